@@ -1,11 +1,13 @@
 """Tests for ConfigManager."""
 
+import json
 import textwrap
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from voice_prompt.config import ConfigManager, DEFAULTS, _deep_merge
+from voice_prompt.config import _YAML_CACHE, ConfigManager, DEFAULTS, _deep_merge
 
 
 class TestDeepMerge:
@@ -20,6 +22,11 @@ class TestDeepMerge:
     def test_new_key(self):
         assert _deep_merge({"a": 1}, {"b": 2}) == {"a": 1, "b": 2}
 
+    def test_does_not_mutate_base(self):
+        base = {"a": {"b": 1}}
+        _deep_merge(base, {"a": {"b": 2}})
+        assert base == {"a": {"b": 1}}
+
 
 class TestConfigManager:
     def test_defaults_when_no_file(self, tmp_path):
@@ -73,7 +80,78 @@ class TestConfigManager:
         cfg.reload()
         assert cfg.hotkeys["record"] == "ctrl+2"
 
+    def test_reload_refreshes_model_cache_dir(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("system:\n  model_cache_dir: /models/a\n")
+        cfg = ConfigManager(config_path=config_file)
+        assert cfg.model_cache_dir == Path("/models/a")
+
+        config_file.write_text("system:\n  model_cache_dir: /models/bb\n")
+        cfg.reload()
+        assert cfg.model_cache_dir == Path("/models/bb")
+
     def test_env_override_model_dir(self, tmp_path, monkeypatch):
         monkeypatch.setenv("VOICE_PROMPT_MODEL_DIR", "/custom/models")
         cfg = ConfigManager(config_path=tmp_path / "nope.yaml")
         assert cfg.system["model_cache_dir"] == "/custom/models"
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("hotkeys:\n  record: ctrl+1\n")
+        ConfigManager(config_path=config_file)
+
+        with patch("voice_prompt.config.yaml.load") as mock_load:
+            cfg = ConfigManager(config_path=config_file)
+            cfg.reload()
+        mock_load.assert_not_called()
+        assert cfg.hotkeys["record"] == "ctrl+1"
+
+    def test_cached_config_is_not_shared(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("system:\n  log_level: DEBUG\n")
+        ConfigManager(config_path=config_file)
+
+        monkeypatch.setenv("VOICE_PROMPT_MODEL_DIR", "/custom/models")
+        ConfigManager(config_path=config_file)
+        monkeypatch.delenv("VOICE_PROMPT_MODEL_DIR")
+
+        cfg = ConfigManager(config_path=config_file)
+        assert cfg.system["model_cache_dir"] == DEFAULTS["system"]["model_cache_dir"]
+
+
+class TestSidecarCache:
+    def test_writes_json_sidecar(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("hotkeys:\n  record: ctrl+1\n")
+        ConfigManager(config_path=config_file)
+
+        sidecar = json.loads((tmp_path / "config.yaml.cache.json").read_text())
+        assert sidecar["data"] == {"hotkeys": {"record": "ctrl+1"}}
+        assert sidecar["size"] == config_file.stat().st_size
+
+    def test_fresh_process_uses_sidecar(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("hotkeys:\n  record: ctrl+1\n")
+        ConfigManager(config_path=config_file)
+        _YAML_CACHE.clear()
+
+        with patch("voice_prompt.config.yaml.load") as mock_load:
+            cfg = ConfigManager(config_path=config_file)
+        mock_load.assert_not_called()
+        assert cfg.hotkeys["record"] == "ctrl+1"
+
+    def test_stale_sidecar_is_ignored(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("hotkeys:\n  record: ctrl+1\n")
+        ConfigManager(config_path=config_file)
+
+        config_file.write_text("hotkeys:\n  record: ctrl+22\n")
+        _YAML_CACHE.clear()
+        cfg = ConfigManager(config_path=config_file)
+        assert cfg.hotkeys["record"] == "ctrl+22"
+
+    def test_non_json_values_skip_sidecar(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("audio:\n  1: one\n")
+        ConfigManager(config_path=config_file)
+        assert not (tmp_path / "config.yaml.cache.json").exists()
@@ -1,5 +1,6 @@
 """Tests for HotkeyManager and _to_pynput_format."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -94,8 +95,8 @@ class TestHotkeyManager:
         mgr.register("ctrl+a", cb2)
         assert len(mgr._bindings) == 1
 
-    def test_registered_callback_is_wrapped_in_thread(self):
-        """The stored callback should spawn a thread when invoked, not call the original directly."""
+    def test_registered_callback_is_wrapped(self):
+        """The stored callback should dispatch to a worker when invoked, not call the original directly."""
         mgr = HotkeyManager()
         original_cb = MagicMock()
         mgr.register("ctrl+shift+v", original_cb)
@@ -104,18 +105,84 @@ class TestHotkeyManager:
         # The stored callback is a wrapper, not the original
         assert stored_cb is not original_cb
 
-    @patch("voice_prompt.hotkey.threading.Thread")
-    def test_registered_callback_spawns_daemon_thread(self, mock_thread_cls):
-        """Invoking the registered wrapper should create a daemon thread targeting the original callback."""
+    def test_registered_callback_is_dispatched_to_workers(self):
+        """Invoking the registered wrapper should hand the original callback to the workers."""
         mgr = HotkeyManager()
+        mgr._dispatch = MagicMock()
         original_cb = MagicMock()
         mgr.register("ctrl+shift+v", original_cb)
 
         stored_cb = mgr._bindings["<ctrl>+<shift>+v"]
         stored_cb()
 
-        mock_thread_cls.assert_called_once_with(target=original_cb, daemon=True)
-        mock_thread_cls.return_value.start.assert_called_once()
+        mgr._dispatch.assert_called_once_with(original_cb)
+
+    def test_registered_callback_runs_off_listener_thread(self):
+        mgr = HotkeyManager()
+        done = threading.Event()
+        ran_on = []
+
+        def callback():
+            ran_on.append(threading.current_thread())
+            done.set()
+
+        mgr.register("ctrl+shift+v", callback)
+        mgr._bindings["<ctrl>+<shift>+v"]()
+
+        assert done.wait(timeout=5)
+        assert ran_on[0] is not threading.current_thread()
+        assert ran_on[0].daemon
+
+    def test_failing_callback_does_not_kill_worker(self):
+        mgr = HotkeyManager()
+        done = threading.Event()
+        mgr.register("ctrl+a", MagicMock(side_effect=RuntimeError("boom")))
+        mgr.register("ctrl+b", done.set)
+
+        for _ in range(3):  # more failures than workers
+            mgr._bindings["<ctrl>+a"]()
+        mgr._bindings["<ctrl>+b"]()
+
+        assert done.wait(timeout=5)
+
+    def test_stop_releases_workers_and_drops_queued_callbacks(self):
+        mgr = HotkeyManager()
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking():
+            started.set()
+            release.wait(timeout=5)
+
+        queued = MagicMock()
+        mgr.register("ctrl+a", blocking)
+        mgr.register("ctrl+b", queued)
+        mgr._bindings["<ctrl>+a"]()
+        mgr._bindings["<ctrl>+a"]()
+        assert started.wait(timeout=5)
+        workers = list(mgr._workers)
+        mgr._bindings["<ctrl>+b"]()  # both workers busy, so this stays queued
+
+        mgr.stop()
+        release.set()
+        for worker in workers:
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+        queued.assert_not_called()
+        assert mgr._workers == []
+
+    def test_dispatch_after_stop_respawns_workers(self):
+        mgr = HotkeyManager()
+        done = threading.Event()
+        mgr.register("ctrl+a", done.set)
+        mgr._bindings["<ctrl>+a"]()
+        assert done.wait(timeout=5)
+        mgr.stop()
+
+        done.clear()
+        mgr._bindings["<ctrl>+a"]()
+        assert done.wait(timeout=5)
+        assert len(mgr._workers) == 2
 
     @patch("voice_prompt.hotkey.keyboard.GlobalHotKeys")
     def test_start_creates_listener(self, mock_ghk_cls):
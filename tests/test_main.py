@@ -0,0 +1,138 @@
+"""Tests for the CLI integration helpers."""
+
+import errno
+import logging
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from voice_prompt import main
+from voice_prompt.main import _acquire_lock, _release_lock, _SizeTrackingRotatingFileHandler
+
+
+def _record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+class TestSizeTrackingRotatingFileHandler:
+    def test_tracks_existing_file_size(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        log_file.write_text("x" * 50)
+        handler = _SizeTrackingRotatingFileHandler(log_file, maxBytes=1000, backupCount=1)
+        try:
+            assert handler._current_size == 50
+            handler.emit(_record("hello"))
+            assert handler._current_size == 56
+        finally:
+            handler.close()
+
+    def test_counts_encoded_bytes(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        handler = _SizeTrackingRotatingFileHandler(
+            log_file, maxBytes=1000, backupCount=1, encoding="utf-8"
+        )
+        try:
+            handler.emit(_record("Transcribing…"))
+            handler.flush()
+            assert handler._current_size == log_file.stat().st_size == 16
+        finally:
+            handler.close()
+
+    def test_rolls_over_at_max_bytes(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        handler = _SizeTrackingRotatingFileHandler(log_file, maxBytes=21, backupCount=1)
+        try:
+            handler.emit(_record("a" * 9))
+            handler.emit(_record("b" * 9))
+            handler.emit(_record("c" * 9))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "app.log.1").read_text() == "a" * 9 + "\n" + "b" * 9 + "\n"
+        assert log_file.read_text() == "c" * 9 + "\n"
+
+    def test_delayed_open(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        handler = _SizeTrackingRotatingFileHandler(
+            log_file, maxBytes=10, backupCount=1, delay=True
+        )
+        try:
+            assert handler.stream is None
+            handler.emit(_record("a" * 9))
+            handler.emit(_record("b" * 9))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "app.log.1").read_text() == "a" * 9 + "\n"
+        assert log_file.read_text() == "b" * 9 + "\n"
+
+    def test_buffers_until_warning(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        handler = _SizeTrackingRotatingFileHandler(log_file, maxBytes=1000, backupCount=1)
+        try:
+            handler.emit(_record("info"))
+            assert log_file.read_text() == ""
+            handler.emit(_record("warn", logging.WARNING))
+            assert log_file.read_text() == "info\nwarn\n"
+        finally:
+            handler.close()
+
+    def test_close_flushes_buffered_records(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        handler = _SizeTrackingRotatingFileHandler(log_file, maxBytes=1000, backupCount=1)
+        handler.emit(_record("info"))
+        handler.close()
+        assert log_file.read_text() == "info\n"
+
+
+class TestSingleInstanceLock:
+    @pytest.fixture(autouse=True)
+    def _lock_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(main, "LOCK_FILE", tmp_path / "voice-prompt.lock")
+        yield
+        _release_lock()
+
+    def test_second_acquire_fails_while_held(self):
+        assert _acquire_lock()
+        held_fd = main._lock_fd
+        assert not _acquire_lock()
+        assert main._lock_fd == held_fd
+
+    def test_release_allows_reacquire(self):
+        assert _acquire_lock()
+        _release_lock()
+        assert main._lock_fd is None
+        assert _acquire_lock()
+
+    def test_leftover_lock_file_does_not_block(self):
+        main.LOCK_FILE.write_text("12345")
+        assert _acquire_lock()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="flock is POSIX-only")
+    def test_lock_errors_other_than_contention_propagate(self):
+        error = OSError(errno.ENOLCK, "No locks available")
+        with patch("fcntl.flock", side_effect=error):
+            with patch.object(main.os, "close", wraps=os.close) as close:
+                with pytest.raises(OSError):
+                    _acquire_lock()
+        close.assert_called_once()
+        assert main._lock_fd is None
+
+
+class TestFinishRecording:
+    def test_failed_transcription_moves_audio(self, tmp_path):
+        audio = tmp_path / "rec.wav"
+        audio.write_bytes(b"RIFF")
+        failed_dir = tmp_path / "failed"
+
+        app = main.VoicePrompt.__new__(main.VoicePrompt)
+        app.config = MagicMock(system={"save_failed_audio": True, "failed_audio_dir": str(failed_dir)})
+        app.recorder = MagicMock(**{"stop.return_value": audio})
+        app.transcriber = MagicMock(**{"transcribe.side_effect": RuntimeError("boom")})
+
+        app._finish_recording()
+
+        assert not audio.exists()
+        assert (failed_dir / "rec.wav").read_bytes() == b"RIFF"
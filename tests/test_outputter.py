@@ -15,24 +15,54 @@ class TestCleanupText:
     def test_empty(self):
         assert _cleanup_text("") == ""
 
+    def test_collapses_other_whitespace(self):
+        assert _cleanup_text("a\tb\nc\r\nd\u00a0e") == "a b c d e"
+
+    def test_clean_text_unchanged(self):
+        assert _cleanup_text("already clean text.") == "already clean text."
+
 
 class TestTextOutputter:
     @patch("voice_prompt.outputter._keyboard")
     def test_type_mode(self, mock_kb):
         out = TextOutputter(mode="type", typing_speed="instant")
         out.output("hi")
-        # pynput .type() called per character
+        # instant mode hands the whole string to pynput in one call
+        mock_kb.type.assert_called_once_with("hi")
+
+    @patch("voice_prompt.outputter.time.sleep")
+    @patch("voice_prompt.outputter._keyboard")
+    def test_typing_speed_types_per_character(self, mock_kb, mock_sleep):
+        out = TextOutputter(mode="type", typing_speed="10")
+        out.output("hi")
         assert mock_kb.type.call_count == 2
 
     @patch("voice_prompt.outputter._keyboard")
     def test_add_newline(self, mock_kb):
         out = TextOutputter(mode="type", add_newline=True)
         out.output("x")
-        # 'x' typed + newline (enter press/release)
-        assert mock_kb.press.called
+        # pynput types "\n" as an Enter press/release
+        mock_kb.type.assert_called_once_with("x\n")
 
     @patch("voice_prompt.outputter._keyboard")
     def test_empty_text_does_nothing(self, mock_kb):
         out = TextOutputter()
         out.output("")
         mock_kb.type.assert_not_called()
+
+    @patch.dict("sys.modules", {"pyperclip": None})
+    @patch("voice_prompt.outputter._linux_clipboard_cmd", return_value=("xclip", "-selection", "clipboard"))
+    @patch("platform.system", return_value="Linux")
+    @patch("subprocess.Popen")
+    def test_clipboard_falls_back_without_pyperclip(self, mock_popen, *_):
+        TextOutputter(mode="clipboard").output("hi")
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args.args[0] == ["xclip", "-selection", "clipboard"]
+
+    @patch("subprocess.Popen")
+    def test_clipboard_prefers_pyperclip(self, mock_popen):
+        fake_pyperclip = MagicMock()
+        with patch.dict("sys.modules", {"pyperclip": fake_pyperclip}):
+            TextOutputter(mode="clipboard").output("hi")
+        fake_pyperclip.copy.assert_called_once_with("hi")
+        mock_popen.assert_not_called()
@@ -1,5 +1,8 @@
 """Tests for AudioRecorder."""
 
+import os
+import threading
+import wave
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -20,14 +23,15 @@ class TestAudioRecorder:
         assert rec.grace_period == 10.0
 
     @patch("voice_prompt.recorder.sd.InputStream")
-    def test_start_sets_recording(self, mock_stream_cls):
+    def test_start_sets_recording(self, mock_stream_cls, tmp_path):
         mock_stream = MagicMock()
         mock_stream_cls.return_value = mock_stream
 
-        rec = AudioRecorder()
+        rec = AudioRecorder(temp_dir=str(tmp_path))
         rec.start()
         assert rec.is_recording
         mock_stream.start.assert_called_once()
+        rec.cancel()
 
     def test_stop_without_start(self):
         rec = AudioRecorder()
@@ -50,26 +54,78 @@ class TestAudioRecorder:
         assert path is not None
         assert path.exists()
         assert path.suffix == ".wav"
+        assert path.stat().st_size == 44 + 3200 * 2
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnchannels() == 1
+            assert wf.getsampwidth() == 2
+            assert wf.getframerate() == 16000
+            assert wf.getnframes() == 3200
+            assert np.all(np.frombuffer(wf.readframes(3200), dtype="<i2") == 5000)
         path.unlink()
 
-    def test_cancel_discards_frames(self):
-        rec = AudioRecorder()
-        rec._frames = [np.zeros((100, 1), dtype=np.int16)]
-        rec._recording = True
+    @pytest.mark.skipif(not hasattr(os, "posix_fallocate"), reason="posix_fallocate unavailable")
+    @patch("voice_prompt.recorder.sd.InputStream")
+    def test_preallocation_is_capped(self, mock_stream_cls, tmp_path):
+        mock_stream_cls.return_value = MagicMock()
+
+        rec = AudioRecorder(max_duration=600.0, temp_dir=str(tmp_path))
+        with patch("voice_prompt.recorder.os.posix_fallocate") as fallocate:
+            rec.start()
+        # 15 s of 16 kHz mono int16 plus the header, not the full 10 minutes
+        assert fallocate.call_args.args[1:] == (0, 44 + 15 * 16000 * 2)
+        rec.cancel()
+
+    @patch("voice_prompt.recorder.sd.InputStream")
+    def test_cancel_discards_frames(self, mock_stream_cls, tmp_path):
+        mock_stream_cls.return_value = MagicMock()
+
+        rec = AudioRecorder(temp_dir=str(tmp_path))
+        rec.start()
+        rec._audio_callback(np.full((1600, 1), 5000, dtype=np.int16), 1600, None, None)
         rec.cancel()
         assert not rec.is_recording
-        assert rec._frames == []
+        assert rec._write_idx == 0
+        assert list(tmp_path.iterdir()) == []
+        assert rec.stop() is None
 
     @patch("voice_prompt.recorder.sd.InputStream")
-    def test_grace_period_auto_stops_when_no_speech(self, mock_stream_cls):
+    def test_stop_without_audio_removes_file(self, mock_stream_cls, tmp_path):
+        mock_stream_cls.return_value = MagicMock()
+
+        rec = AudioRecorder(temp_dir=str(tmp_path))
+        rec.start()
+        assert rec.stop() is None
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("voice_prompt.recorder.sd.InputStream")
+    def test_stop_after_concurrent_cancel_returns_none(self, mock_stream_cls, tmp_path):
+        mock_stream = MagicMock()
+        mock_stream_cls.return_value = mock_stream
+
+        rec = AudioRecorder(temp_dir=str(tmp_path))
+        rec.start()
+        rec._audio_callback(np.full((1600, 1), 5000, dtype=np.int16), 1600, None, None)
+
+        # cancel() wins the race while stop() is closing the stream
+        def cancel_during_close():
+            mock_stream.close.side_effect = None
+            rec.cancel()
+
+        mock_stream.close.side_effect = cancel_during_close
+        assert rec.stop() is None
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("voice_prompt.recorder.sd.InputStream")
+    def test_grace_period_auto_stops_when_no_speech(self, mock_stream_cls, tmp_path):
         """When no speech is detected within the grace period, recording stops automatically."""
         mock_stream = MagicMock()
         mock_stream_cls.return_value = mock_stream
 
-        auto_stopped = []
+        auto_stopped = threading.Event()
         rec = AudioRecorder(
             grace_period=0.5,  # 0.5 seconds = 5 chunks at 100ms each
-            on_auto_stop=lambda: auto_stopped.append(True),
+            temp_dir=str(tmp_path),
+            on_auto_stop=auto_stopped.set,
         )
         rec.start()
 
@@ -79,14 +135,34 @@ class TestAudioRecorder:
             rec._audio_callback(silent_audio, 1600, None, None)
 
         assert not rec.is_recording
+        assert auto_stopped.wait(timeout=5)
+        rec.cancel()
 
     @patch("voice_prompt.recorder.sd.InputStream")
-    def test_grace_period_does_not_stop_when_speech_detected(self, mock_stream_cls):
+    def test_start_refuses_until_auto_stopped_recording_is_saved(self, mock_stream_cls, tmp_path):
+        mock_stream_cls.return_value = MagicMock()
+
+        rec = AudioRecorder(max_duration=0.1, temp_dir=str(tmp_path))
+        rec.start()
+        rec._audio_callback(np.full((1600, 1), 5000, dtype=np.int16), 1600, None, None)
+        assert not rec.is_recording  # auto-stopped, stop() not called yet
+
+        rec.start()
+        assert not rec.is_recording
+        assert len(list(tmp_path.iterdir())) == 1
+
+        path = rec.stop()
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 1600
+        path.unlink()
+
+    @patch("voice_prompt.recorder.sd.InputStream")
+    def test_grace_period_does_not_stop_when_speech_detected(self, mock_stream_cls, tmp_path):
         """Speech within the grace period prevents the grace-period auto-stop."""
         mock_stream = MagicMock()
         mock_stream_cls.return_value = mock_stream
 
-        rec = AudioRecorder(grace_period=0.5)
+        rec = AudioRecorder(grace_period=0.5, temp_dir=str(tmp_path))
         rec.start()
 
         # Feed loud audio (speech) within the grace period
@@ -96,14 +172,15 @@ class TestAudioRecorder:
 
         assert rec.is_recording
         assert rec._speech_detected
+        rec.cancel()
 
     @patch("voice_prompt.recorder.sd.InputStream")
-    def test_silence_after_speech_auto_stops(self, mock_stream_cls):
+    def test_silence_after_speech_auto_stops(self, mock_stream_cls, tmp_path):
         """After speech is detected, sustained silence triggers auto-stop."""
         mock_stream = MagicMock()
         mock_stream_cls.return_value = mock_stream
 
-        rec = AudioRecorder(silence_duration=0.3, grace_period=10.0)
+        rec = AudioRecorder(silence_duration=0.3, grace_period=10.0, temp_dir=str(tmp_path))
         rec.start()
 
         # First deliver speech
@@ -117,15 +194,49 @@ class TestAudioRecorder:
             rec._audio_callback(silent_audio, 1600, None, None)
 
         assert not rec.is_recording
+        rec.cancel()
 
     @patch("voice_prompt.recorder.sd.InputStream")
-    def test_custom_grace_period_value(self, mock_stream_cls):
+    def test_custom_grace_period_value(self, mock_stream_cls, tmp_path):
         """Verify that custom grace_period is stored and used for chunk calculation."""
         mock_stream = MagicMock()
         mock_stream_cls.return_value = mock_stream
 
-        rec = AudioRecorder(grace_period=5.0)
+        rec = AudioRecorder(grace_period=5.0, temp_dir=str(tmp_path))
         rec.start()
         assert rec.grace_period == 5.0
         # 5.0 seconds / 0.1 second chunks = 50 chunks
         assert rec._grace_chunks == 50
+        rec.cancel()
+
+    @patch("voice_prompt.recorder.sd.InputStream")
+    def test_silence_threshold_matches_mean_amplitude(self, mock_stream_cls, tmp_path):
+        """Chunks are silent when mean(|x|) / 32768 falls below silence_threshold."""
+        mock_stream_cls.return_value = MagicMock()
+
+        rec = AudioRecorder(silence_threshold=0.01, temp_dir=str(tmp_path))  # mean |x| threshold of 327.68
+        rec.start()
+
+        rec._audio_callback(np.full((1600, 1), -327, dtype=np.int16), 1600, None, None)
+        assert not rec._speech_detected
+
+        rec._audio_callback(np.full((1600, 1), -328, dtype=np.int16), 1600, None, None)
+        assert rec._speech_detected
+        rec.cancel()
+
+    @patch("voice_prompt.recorder.sd.InputStream")
+    def test_max_duration_caps_recorded_audio(self, mock_stream_cls, tmp_path):
+        mock_stream_cls.return_value = MagicMock()
+
+        rec = AudioRecorder(max_duration=0.2, temp_dir=str(tmp_path))
+        rec.start()
+
+        loud_audio = np.full((1600, 1), 5000, dtype=np.int16)
+        for _ in range(2):
+            rec._audio_callback(loud_audio, 1600, None, None)
+        assert not rec.is_recording
+
+        path = rec.stop()
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 3200
+        path.unlink()
@@ -1,5 +1,6 @@
 """Tests for WhisperTranscriber."""
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -27,6 +28,13 @@ class TestWhisperTranscriber:
         assert device == "cpu"
         assert compute == "int8"
 
+    def test_resolve_device_is_cached(self):
+        t = WhisperTranscriber(device="auto")
+        with patch("voice_prompt.transcriber.importlib.util.find_spec", return_value=None) as spec:
+            assert t._resolve_device() == ("cpu", "int8")
+            assert t._resolve_device() == ("cpu", "int8")
+        spec.assert_called_once_with("torch")
+
     def test_resolve_device_explicit(self):
         t = WhisperTranscriber(device="cpu", compute_type="float32")
         device, compute = t._resolve_device()
@@ -82,3 +90,67 @@ class TestWhisperTranscriber:
         t = WhisperTranscriber(device="cpu")
         result = t.transcribe(Path("fake.wav"))
         assert result == "Hello world"
+
+    @patch("faster_whisper.WhisperModel")
+    def test_transcribe_skips_blank_segments(self, mock_model_cls):
+        mock_model = MagicMock()
+        mock_model_cls.return_value = mock_model
+
+        segs = [MagicMock(text=t) for t in (" Hello", "  ", "", " world ")]
+        fake_info = MagicMock()
+        fake_info.language = "en"
+        fake_info.language_probability = 0.99
+        fake_info.duration = 2.5
+        mock_model.transcribe.return_value = (iter(segs), fake_info)
+
+        t = WhisperTranscriber(device="cpu")
+        assert t.transcribe(Path("fake.wav")) == "Hello world"
+
+    @patch("faster_whisper.WhisperModel")
+    def test_transcribe_options(self, mock_model_cls):
+        mock_model = MagicMock()
+        mock_model_cls.return_value = mock_model
+        mock_model.transcribe.return_value = ([], MagicMock(language_probability=1.0, duration=0.0))
+
+        WhisperTranscriber(device="cpu").transcribe(Path("fake.wav"))
+        kwargs = mock_model.transcribe.call_args.kwargs
+        assert kwargs["word_timestamps"] is False
+        assert kwargs["vad_parameters"] == {"min_silence_duration_ms": 500}
+
+        mock_model.transcribe.reset_mock()
+        WhisperTranscriber(device="cpu", vad_filter=False).transcribe(Path("fake.wav"))
+        assert "vad_parameters" not in mock_model.transcribe.call_args.kwargs
+
+    @patch("faster_whisper.WhisperModel")
+    def test_preload_loads_in_background(self, mock_model_cls):
+        t = WhisperTranscriber(device="cpu")
+        t.preload()
+        t.load_model()  # waits for the background load instead of starting another
+        assert t.is_loaded
+        mock_model_cls.assert_called_once()
+
+    @patch("faster_whisper.WhisperModel")
+    def test_preload_reports_success(self, mock_model_cls):
+        t = WhisperTranscriber(device="cpu")
+        loaded = threading.Event()
+        on_error = MagicMock()
+        t.preload(on_loaded=loaded.set, on_error=on_error)
+        assert loaded.wait(timeout=5)
+        on_error.assert_not_called()
+
+    @patch("faster_whisper.WhisperModel", side_effect=OSError("offline"))
+    def test_preload_reports_failure(self, mock_model_cls):
+        t = WhisperTranscriber(device="cpu")
+        errors = []
+        failed = threading.Event()
+        on_loaded = MagicMock()
+
+        def on_error(exc):
+            errors.append(exc)
+            failed.set()
+
+        t.preload(on_loaded=on_loaded, on_error=on_error)
+        assert failed.wait(timeout=5)
+        assert isinstance(errors[0], OSError)
+        on_loaded.assert_not_called()
+        assert not t.is_loaded
@@ -1,14 +1,27 @@
 """Configuration management for Voice Prompt."""
 
+import copy
+import json
 import logging
 import os
+from collections import OrderedDict
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Resolved once at import and shared by every default path below
+_HOME = Path.home()
+_APP_DIR = _HOME / ".voice_prompt"
+
 DEFAULTS: dict[str, Any] = {
     "hotkeys": {
         "record": "ctrl+shift+q",
@@ -40,13 +53,13 @@ DEFAULTS: dict[str, Any] = {
     },
     "system": {
         "log_level": "INFO",
-        "log_file": str(Path.home() / ".voice_prompt" / "voice-prompt.log"),
+        "log_file": str(_APP_DIR / "voice-prompt.log"),
         "log_max_size": 10,
         "log_backup_count": 3,
-        "model_cache_dir": str(Path.home() / ".cache" / "whisper"),
+        "model_cache_dir": str(_HOME / ".cache" / "whisper"),
         "temp_dir": None,
         "save_failed_audio": True,
-        "failed_audio_dir": str(Path.home() / ".voice_prompt" / "failed"),
+        "failed_audio_dir": str(_APP_DIR / "failed"),
     },
     "notifications": {
         "enabled": True,
@@ -54,23 +67,84 @@ DEFAULTS: dict[str, Any] = {
     },
 }
 
-DEFAULT_CONFIG_PATH = Path.home() / ".voice_prompt" / "config.yaml"
+DEFAULT_CONFIG_PATH = _APP_DIR / "config.yaml"
+
+# Parsed user configs keyed by path → (mtime_ns, size, parsed dict), most recent last
+_YAML_CACHE: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+_SIDECAR_SUFFIX = ".cache.json"
+
+
+def _read_sidecar(config_path: Path, st: os.stat_result) -> Optional[dict]:
+    """Return the JSON-cached parse of *config_path* if it matches the YAML's stat."""
+    sidecar = config_path.with_name(config_path.name + _SIDECAR_SUFFIX)
+    try:
+        with open(sidecar, "rb") as f:
+            cached = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("mtime_ns") != st.st_mtime_ns
+        or cached.get("size") != st.st_size
+    ):
+        return None
+    data = cached.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_sidecar(config_path: Path, st: os.stat_result, data: dict) -> None:
+    """Best-effort write of a JSON copy of the parsed YAML next to the config file."""
+    payload = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}
+    try:
+        blob = json.dumps(payload, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return
+    # YAML allows values JSON can't round-trip (non-string keys, dates); skip those
+    if json.loads(blob)["data"] != data:
+        return
+
+    sidecar = config_path.with_name(config_path.name + _SIDECAR_SUFFIX)
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(blob)
+        os.replace(tmp, sidecar)
+    except OSError:
+        logger.debug("Could not write config cache %s", sidecar, exc_info=True)
+        tmp.unlink(missing_ok=True)
+
+
+def _merge_into(dst: dict, src: dict) -> None:
+    """Merge src into dst in place, descending into nested dicts without recursion."""
+    stack = [(dst, src)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
 
 
 def _deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge override dict into base dict."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    """Return a deep copy of base with override merged into it."""
+    result = copy.deepcopy(base)
+    _merge_into(result, override)
     return result
 
 
 class ConfigManager:
     """Loads, validates, and provides access to configuration."""
 
+    # cached_property accessors below; reload() drops them so they re-resolve
+    _CACHED_ACCESSORS = (
+        "hotkeys", "audio", "transcription", "output",
+        "system", "notifications", "model_cache_dir", "log_level",
+    )
+
     def __init__(self, config_path: Optional[Path] = None) -> None:
         env_path = os.environ.get("VOICE_PROMPT_CONFIG")
         if config_path:
@@ -82,15 +156,46 @@ class ConfigManager:
 
         self.config = self._load()
 
-    def _load(self) -> dict[str, Any]:
-        user_config: dict[str, Any] = {}
-        if self.config_path.exists():
+    def _read_user_config(self) -> dict[str, Any]:
+        """Parse the user YAML, reusing the cached result while the file is unchanged."""
+        try:
+            st = self.config_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+        key = str(self.config_path)
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _YAML_CACHE.move_to_end(key)
+            logger.debug("Using cached config for %s", self.config_path)
+            return copy.deepcopy(cached[2])
+
+        user_config = _read_sidecar(self.config_path, st)
+        if user_config is not None:
+            logger.info("Loaded config from %s (cached)", self.config_path)
+        else:
             try:
-                with open(self.config_path, encoding="utf-8") as f:
-                    user_config = yaml.safe_load(f) or {}
-                logger.info("Loaded config from %s", self.config_path)
+                # Bytes let LibYAML do its own decoding instead of a separate utf-8 pass
+                with open(self.config_path, "rb") as f:
+                    user_config = yaml.load(f, Loader=_YamlLoader) or {}
+            except FileNotFoundError:
+                return {}  # removed since the stat above
             except Exception:
                 logger.warning("Failed to read %s, using defaults", self.config_path, exc_info=True)
+                return {}
+            logger.info("Loaded config from %s", self.config_path)
+            if isinstance(user_config, dict):
+                _write_sidecar(self.config_path, st, user_config)
+
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, user_config)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+        # Callers may mutate the result (e.g. env overrides), so hand out a copy
+        return copy.deepcopy(user_config)
+
+    def _load(self) -> dict[str, Any]:
+        user_config = self._read_user_config()
 
         # Override model cache dir from env if set
         env_model_dir = os.environ.get("VOICE_PROMPT_MODEL_DIR")
@@ -102,40 +207,42 @@ class ConfigManager:
     def reload(self) -> None:
         """Reload configuration from disk."""
         self.config = self._load()
+        for name in self._CACHED_ACCESSORS:
+            self.__dict__.pop(name, None)
 
     # -- convenience accessors --------------------------------------------------
 
     def get(self, section: str, key: str, fallback: Any = None) -> Any:
         return self.config.get(section, {}).get(key, fallback)
 
-    @property
+    @cached_property
     def hotkeys(self) -> dict:
         return self.config["hotkeys"]
 
-    @property
+    @cached_property
     def audio(self) -> dict:
         return self.config["audio"]
 
-    @property
+    @cached_property
     def transcription(self) -> dict:
         return self.config["transcription"]
 
-    @property
+    @cached_property
     def output(self) -> dict:
         return self.config["output"]
 
-    @property
+    @cached_property
     def system(self) -> dict:
         return self.config["system"]
 
-    @property
+    @cached_property
     def notifications(self) -> dict:
         return self.config["notifications"]
 
-    @property
+    @cached_property
     def model_cache_dir(self) -> Path:
         return Path(self.config["system"]["model_cache_dir"]).expanduser()
 
-    @property
+    @cached_property
     def log_level(self) -> str:
         return self.config["system"]["log_level"]
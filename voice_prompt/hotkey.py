@@ -1,6 +1,9 @@
 """Global hotkey listener using pynput's built-in GlobalHotKeys."""
 
+import functools
 import logging
+import queue
+import re
 import threading
 from typing import Callable, Optional
 
@@ -21,17 +24,17 @@ _MODIFIER_MAP = {
     "tab": "<tab>",
 }
 
+_KEY_RE = re.compile(r"[^+]+")
 
+# Two workers so a cancel isn't stuck behind a record toggle that is transcribing
+_NUM_WORKERS = 2
+
+
+@functools.lru_cache(maxsize=64)
 def _to_pynput_format(combo: str) -> str:
     """Convert 'ctrl+shift+q' → '<ctrl>+<shift>+q' for pynput."""
-    parts = []
-    for part in combo.lower().split("+"):
-        part = part.strip()
-        if part in _MODIFIER_MAP:
-            parts.append(_MODIFIER_MAP[part])
-        else:
-            parts.append(part)
-    return "+".join(parts)
+    combo = "".join(combo.lower().split())
+    return _KEY_RE.sub(lambda m: _MODIFIER_MAP.get(m.group(), m.group()), combo)
 
 
 class HotkeyManager:
@@ -40,13 +43,35 @@ class HotkeyManager:
     def __init__(self) -> None:
         self._bindings: dict[str, Callable] = {}
         self._listener: Optional[keyboard.GlobalHotKeys] = None
+        # Reused daemon workers so a keypress doesn't pay for spawning a thread,
+        # and a callback still in flight (transcribing, typing) doesn't hold up exit
+        self._queue: queue.Queue[Optional[Callable]] = queue.Queue()
+        self._workers: list[threading.Thread] = []
+
+    def _dispatch(self, callback: Callable) -> None:
+        if not self._workers:
+            for i in range(_NUM_WORKERS):
+                worker = threading.Thread(target=self._work, name=f"hotkey-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+        self._queue.put(callback)
+
+    def _work(self) -> None:
+        while True:
+            callback = self._queue.get()
+            if callback is None:  # sentinel from stop()
+                return
+            try:
+                callback()
+            except Exception:
+                logger.exception("Hotkey callback failed")
 
     def register(self, combo: str, callback: Callable) -> None:
         """Register a hotkey combination (e.g. 'ctrl+shift+r')."""
         pynput_combo = _to_pynput_format(combo)
-        # Wrap callback so it runs in a separate thread and won't block the listener
+        # Wrap callback so it runs on a worker thread and won't block the listener
         def _threaded() -> None:
-            threading.Thread(target=callback, daemon=True).start()
+            self._dispatch(callback)
         self._bindings[pynput_combo] = _threaded
         logger.info("Registered hotkey: %s -> %s", combo, pynput_combo)
 
@@ -58,8 +83,21 @@ class HotkeyManager:
         logger.info("Hotkey listener started")
 
     def stop(self) -> None:
-        """Stop the hotkey listener."""
+        """Stop the hotkey listener and release the callback workers."""
         if self._listener:
             self._listener.stop()
             self._listener = None
             logger.info("Hotkey listener stopped")
+        self._stop_workers()
+
+    def _stop_workers(self) -> None:
+        # Drop callbacks that haven't started, then send each worker a sentinel so
+        # it exits once its current callback returns; the next dispatch respawns them.
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in self._workers:
+            self._queue.put(None)
+        self._workers = []
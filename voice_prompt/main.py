@@ -1,44 +1,140 @@
 """CLI entry-point and integration layer for Voice Prompt."""
 
 import argparse
+import errno
 import logging
 import os
 import shutil
+import stat
+import sys
+import threading
 import time
+from io import TextIOWrapper
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Optional, cast
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 from voice_prompt.config import ConfigManager
-from voice_prompt.hotkey import HotkeyManager
-from voice_prompt.outputter import TextOutputter
-from voice_prompt.recorder import AudioRecorder
 from voice_prompt.transcriber import WhisperTranscriber
 
+# hotkey/outputter (pynput) and recorder (sounddevice → PortAudio) load native
+# libraries at import time, so they are imported only by the commands that need them.
+
 console = Console()
 logger = logging.getLogger("voice_prompt")
 
 LOCK_FILE = Path.home() / ".voice_prompt" / "voice-prompt.lock"
 
 
+# Descriptor holding the single-instance lock for the life of the process
+_lock_fd: Optional[int] = None
+
+
 def _acquire_lock() -> bool:
-    """Try to acquire a lock file. Returns False if another instance is running."""
+    """Try to lock LOCK_FILE. Returns False if another instance is running.
+
+    The OS drops the lock when the process exits, even after a crash, so a
+    stale lock file never blocks the next start.
+    """
+    global _lock_fd
     LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
-    if LOCK_FILE.exists():
-        try:
-            old_pid = int(LOCK_FILE.read_text().strip())
-            os.kill(old_pid, 0)  # signal 0 = just check if alive
+    fd = os.open(LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError as exc:
+        os.close(fd)
+        # Contention is EWOULDBLOCK from flock, EACCES/EDEADLK from msvcrt.locking;
+        # anything else (e.g. ENOLCK) is a real error, not another instance
+        if isinstance(exc, BlockingIOError) or exc.errno in (errno.EACCES, errno.EDEADLK):
             return False
-        except (OSError, ValueError):
-            pass  # process is dead or bad pid, stale lock
-    LOCK_FILE.write_text(str(os.getpid()))
+        raise
+    _lock_fd = fd
     return True
 
 
 def _release_lock() -> None:
-    LOCK_FILE.unlink(missing_ok=True)
+    global _lock_fd
+    if _lock_fd is not None:
+        os.close(_lock_fd)  # closing the descriptor releases the lock
+        _lock_fd = None
+
+
+class _SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that tracks the file size instead of seeking on every record.
+
+    The stdlib handler checks ``os.path.exists`` and ``stream.tell()`` per emit;
+    here the size is read once with ``fstat`` when the file is opened and then
+    advanced by the encoded byte length of each record written.
+
+    Records below WARNING stay in a 64 KB write buffer instead of being flushed
+    one syscall at a time; rotation, close and ``logging.shutdown()`` at exit
+    flush whatever is pending.
+    """
+
+    buffer_size = 64 * 1024
+
+    def _open(self) -> TextIOWrapper:
+        stream = cast(
+            TextIOWrapper,
+            open(
+                self.baseFilename,
+                self.mode,
+                buffering=self.buffer_size,
+                encoding=self.encoding,
+                errors=self.errors,
+            ),
+        )
+        self._stream_encoding = stream.encoding
+        st = os.fstat(stream.fileno())
+        self._current_size = st.st_size
+        # Never rotate special files such as /dev/null
+        self._rotatable = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        return self._would_overflow(self._byte_len(self.format(record) + self.terminator))
+
+    def _byte_len(self, msg: str) -> int:
+        """Bytes *msg* takes on disk, including text-mode newline translation."""
+        if msg.isascii():
+            size = len(msg)
+        else:
+            size = len(msg.encode(self._stream_encoding, self.errors or "strict"))
+        if os.linesep != "\n":
+            size += msg.count("\n") * (len(os.linesep) - 1)
+        return size
+
+    def _would_overflow(self, size: int) -> bool:
+        return self.maxBytes > 0 and self._rotatable and self._current_size + size >= self.maxBytes
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            size = self._byte_len(msg)
+            if self._would_overflow(size):
+                self.doRollover()
+                if self.stream is None:  # delay=True leaves it closed after rotation
+                    self.stream = self._open()
+            self.stream.write(msg)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            self._current_size += size
+        except Exception:
+            self.handleError(record)
 
 
 def _setup_logging(
@@ -52,10 +148,9 @@ def _setup_logging(
     if log_file:
         log_path = Path(log_file).expanduser()
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        from logging.handlers import RotatingFileHandler
 
         handlers.append(
-            RotatingFileHandler(
+            _SizeTrackingRotatingFileHandler(
                 log_path,
                 maxBytes=log_max_size * 1024 * 1024,
                 backupCount=log_backup_count,
@@ -91,6 +186,10 @@ class VoicePrompt:
     """Main application that glues all components together."""
 
     def __init__(self, config: ConfigManager) -> None:
+        from voice_prompt.hotkey import HotkeyManager
+        from voice_prompt.outputter import TextOutputter
+        from voice_prompt.recorder import AudioRecorder
+
         self.config = config
 
         self.recorder = AudioRecorder(
@@ -126,7 +225,7 @@ class VoicePrompt:
         self.hotkey_mgr = HotkeyManager()
         self._notify_enabled = config.notifications["enabled"]
         self._notify_timeout = config.notifications["timeout"]
-        self._running = False
+        self._stop_event = threading.Event()
 
     # -- hotkey callbacks ------------------------------------------------------
 
@@ -139,7 +238,8 @@ class VoicePrompt:
     def _start_recording(self) -> None:
         try:
             self.recorder.start()
-            console.print("[bold green]Recording…[/] Press hotkey again to stop.")
+            if self.recorder.is_recording:
+                console.print("[bold green]Recording…[/] Press hotkey again to stop.")
         except Exception:
             logger.exception("Failed to start recording")
 
@@ -157,7 +257,8 @@ class VoicePrompt:
                 failed_dir = Path(self.config.system["failed_audio_dir"]).expanduser()
                 failed_dir.mkdir(parents=True, exist_ok=True)
                 dest = failed_dir / audio_path.name
-                shutil.copy2(audio_path, dest)
+                # A rename when both dirs share a filesystem; copy + delete otherwise
+                shutil.move(audio_path, dest)
                 logger.info("Saved failed audio to %s", dest)
             return
         finally:
@@ -174,12 +275,9 @@ class VoicePrompt:
             self.recorder.cancel()
             console.print("[yellow]Recording cancelled.[/]")
 
-    # -- lifecycle -------------------------------------------------------------
+    # -- model preload callbacks -----------------------------------------------
 
-    def run(self) -> None:
-        """Start listening for hotkeys (blocks until interrupted)."""
-        console.print("[cyan]Loading Whisper model into memory…[/]")
-        self.transcriber.load_model()
+    def _on_model_loaded(self) -> None:
         console.print("[green]Model ready![/]")
         _notify(
             "Voice Prompt",
@@ -188,6 +286,24 @@ class VoicePrompt:
             enabled=self._notify_enabled,
         )
 
+    def _on_model_error(self, exc: Exception) -> None:
+        console.print(f"[red]Failed to load Whisper model:[/] {exc}")
+        _notify(
+            "Voice Prompt",
+            "Failed to load the Whisper model. Check the log for details.",
+            timeout=self._notify_timeout,
+            enabled=self._notify_enabled,
+        )
+
+    # -- lifecycle -------------------------------------------------------------
+
+    def run(self) -> None:
+        """Start listening for hotkeys (blocks until interrupted)."""
+        # Load the model while hotkeys are being set up; the first
+        # transcription waits for it if it's still loading.
+        console.print("[cyan]Loading Whisper model in the background…[/]")
+        self.transcriber.preload(on_loaded=self._on_model_loaded, on_error=self._on_model_error)
+
         self.hotkey_mgr.register(
             self.config.hotkeys["record"], self._on_record_toggle
         )
@@ -196,7 +312,6 @@ class VoicePrompt:
         )
         self.hotkey_mgr.start()
 
-        self._running = True
         record_key = self.config.hotkeys["record"]
         console.print(
             f"[bold]Voice Prompt running.[/] Press [cyan]{record_key}[/] to record, "
@@ -209,9 +324,11 @@ class VoicePrompt:
             enabled=self._notify_enabled,
         )
 
+        # Sleep until Ctrl+C instead of polling. The timeout only bounds how long
+        # Windows takes to notice, since its lock waits aren't interrupted by signals.
         try:
-            while self._running:
-                time.sleep(0.1)
+            while not self._stop_event.wait(1.0):
+                pass
         except KeyboardInterrupt:
             pass
         finally:
@@ -243,6 +360,8 @@ def _cmd_test(args: argparse.Namespace) -> None:
     cfg = ConfigManager(config_path=Path(args.config) if args.config else None)
     _setup_logging(cfg.log_level, None)
 
+    from voice_prompt.recorder import AudioRecorder
+
     console.print("[bold]Test mode[/] — recording for 5 seconds…")
     recorder = AudioRecorder(
         sample_rate=cfg.audio["sample_rate"],
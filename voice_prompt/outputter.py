@@ -1,22 +1,40 @@
 """Text output — type or copy transcription results."""
 
+import functools
 import logging
 import re
+import shutil
 import time
 from typing import Optional
 
-from pynput.keyboard import Controller, Key
+from pynput.keyboard import Controller
 
 logger = logging.getLogger(__name__)
 
 _keyboard = Controller()
 
+_WS_RE = re.compile(r"\s+")
+
 
 def _cleanup_text(text: str) -> str:
     """Remove extraneous whitespace and common transcription artefacts."""
-    text = re.sub(r"\s+", " ", text)
     text = text.strip()
-    return text
+    # Whisper output is usually already single-spaced. isprintable() is False
+    # for every whitespace character except " ", so this skips the regex exactly
+    # when it would have nothing to collapse.
+    if "  " not in text and text.isprintable():
+        return text
+    return _WS_RE.sub(" ", text)
+
+
+@functools.cache
+def _linux_clipboard_cmd() -> Optional[tuple[str, ...]]:
+    """Return the clipboard command to use, searching PATH only once per process."""
+    if shutil.which("xclip"):
+        return ("xclip", "-selection", "clipboard")
+    if shutil.which("xsel"):
+        return ("xsel", "--clipboard", "--input")
+    return None
 
 
 class TextOutputter:
@@ -54,24 +72,15 @@ class TextOutputter:
         logger.info("Typing %d characters (delay=%s)", len(text), self.typing_speed)
         time.sleep(0.2)  # let audio stream fully close
 
+        # pynput's type() sends "\n" as Key.enter, so newlines need no special case
         delay = self._parse_delay()
         if delay:
             for char in text:
-                if char == "\n":
-                    _keyboard.press(Key.enter)
-                    _keyboard.release(Key.enter)
-                else:
-                    _keyboard.type(char)
+                _keyboard.type(char)
                 time.sleep(delay)
         else:
-            # Type entire string at once for instant mode
-            lines = text.split("\n")
-            for i, line in enumerate(lines):
-                if i > 0:
-                    _keyboard.press(Key.enter)
-                    _keyboard.release(Key.enter)
-                if line:
-                    _keyboard.type(line)
+            # Type entire string in one call for instant mode
+            _keyboard.type(text)
 
     def _parse_delay(self) -> Optional[float]:
         if self.typing_speed == "instant":
@@ -84,31 +93,29 @@ class TextOutputter:
     @staticmethod
     def _copy_to_clipboard(text: str) -> None:
         """Copy text to clipboard using platform-appropriate method."""
+        try:
+            import pyperclip
+
+            pyperclip.copy(text)
+        except Exception:
+            pass  # not installed or no usable backend; fall back to the system tools
+        else:
+            logger.info("Copied %d characters to clipboard", len(text))
+            return
+
         import platform
+        import subprocess
 
-        system = platform.system()
-        if system == "Windows":
-            import subprocess
+        if platform.system() == "Windows":
             process = subprocess.Popen(["clip"], stdin=subprocess.PIPE)
             process.communicate(text.encode("utf-16le"))
         else:
             # Linux — try xclip, then xsel
-            import shutil
-            import subprocess
-            if shutil.which("xclip"):
-                p = subprocess.Popen(
-                    ["xclip", "-selection", "clipboard"],
-                    stdin=subprocess.PIPE,
-                )
-                p.communicate(text.encode())
-            elif shutil.which("xsel"):
-                p = subprocess.Popen(
-                    ["xsel", "--clipboard", "--input"],
-                    stdin=subprocess.PIPE,
-                )
-                p.communicate(text.encode())
-            else:
+            cmd = _linux_clipboard_cmd()
+            if cmd is None:
                 logger.error("No clipboard tool found (install xclip or xsel)")
                 return
+            p = subprocess.Popen(list(cmd), stdin=subprocess.PIPE)
+            p.communicate(text.encode())
 
         logger.info("Copied %d characters to clipboard", len(text))
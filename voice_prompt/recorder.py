@@ -1,17 +1,27 @@
 """Audio recording using sounddevice."""
 
 import logging
+import math
+import os
 import tempfile
 import threading
 import wave
 from pathlib import Path
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, BinaryIO, Callable, Optional
 
 import numpy as np
 import sounddevice as sd
 
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on the WAV space reserved up front. glibc emulates posix_fallocate
+# by writing every block where the filesystem lacks it, and on tmpfs the
+# reservation is RAM, so it must not scale with max_duration.
+_PREALLOCATE_SECONDS = 15.0
+
 
 class AudioRecorder:
     """Captures microphone audio to a WAV file."""
@@ -36,9 +46,28 @@ class AudioRecorder:
         self.temp_dir = temp_dir
         self.on_auto_stop = on_auto_stop
 
+        # Derived per-chunk constants, computed once rather than on every callback
+        self._chunk_size = int(self.sample_rate * 0.1)  # 100ms chunks
+        self._max_chunks = int(self.max_duration / 0.1)
+        self._silence_chunks_needed = int(self.silence_duration / 0.1)
+        self._grace_chunks = int(self.grace_period / 0.1)
+        prealloc_chunks = min(self._max_chunks, int(_PREALLOCATE_SECONDS / 0.1))
+        self._prealloc_bytes = 44 + prealloc_chunks * self._chunk_size * self.channels * 2
+        # mean(|x|) / 32768 < threshold  ⇔  sum(|x|) < threshold * 32768 * n
+        self._silence_int_threshold = math.ceil(
+            self.silence_threshold * 32768 * self._chunk_size * self.channels
+        )
+
         self._recording = False
         self._speech_detected = False
-        self._frames: list[np.ndarray] = []
+        # Audio is streamed straight into the WAV file while recording
+        self._wav_path: Optional[Path] = None
+        self._wav_file: Optional[BinaryIO] = None
+        self._wf: Optional[wave.Wave_write] = None
+        self._write: Optional[Callable[[ReadableBuffer], None]] = None  # bound _wf.writeframesraw
+        self._write_idx = 0  # frames written so far
+        # Reused output for |x| so the silence check doesn't allocate per callback
+        self._abs_scratch = np.empty((self._chunk_size, self.channels), dtype=np.int32)
         self._lock = threading.Lock()
 
     @property
@@ -50,26 +79,47 @@ class AudioRecorder:
         if self._recording:
             logger.warning("Already recording")
             return
+        if self._wf is not None:
+            # Auto-stopped, but the on_auto_stop callback hasn't called stop() yet
+            logger.warning("Previous recording is still being saved")
+            return
 
-        self._frames = []
+        fd, name = tempfile.mkstemp(suffix=".wav", dir=self.temp_dir)
+        self._wav_path = Path(name)
+        self._wav_file = os.fdopen(fd, "wb", buffering=1 << 16)
+        try:
+            # Reserve blocks for the start of the recording so early writes from
+            # the audio callback don't wait on filesystem block allocation
+            os.posix_fallocate(fd, 0, self._prealloc_bytes)
+        except (AttributeError, OSError):
+            pass  # best effort; the WAV simply grows as it is written
+        self._wf = wave.open(self._wav_file, "wb")
+        self._wf.setnchannels(self.channels)
+        self._wf.setsampwidth(2)  # 16-bit
+        self._wf.setframerate(self.sample_rate)
+        self._write = self._wf.writeframesraw
+
+        self._write_idx = 0
         self._recording = True
         self._speech_detected = False
         self._silent_chunks = 0
-        self._chunk_size = int(self.sample_rate * 0.1)  # 100ms chunks
-        self._max_chunks = int(self.max_duration / 0.1)
-        self._silence_chunks_needed = int(self.silence_duration / 0.1)
-        self._grace_chunks = int(self.grace_period / 0.1)
 
         logger.info("Recording started (sample_rate=%d)", self.sample_rate)
 
-        self._stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            dtype="int16",
-            blocksize=self._chunk_size,
-            callback=self._audio_callback,
-        )
-        self._stream.start()
+        try:
+            self._stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype="int16",
+                blocksize=self._chunk_size,
+                callback=self._audio_callback,
+            )
+            self._stream.start()
+        except Exception:
+            self._recording = False
+            with self._lock:
+                self._close_wav().unlink(missing_ok=True)
+            raise
 
     def _audio_callback(
         self, indata: np.ndarray, frames: int, time_info: object, status: object
@@ -79,47 +129,74 @@ class AudioRecorder:
         if not self._recording:
             return
 
+        # Silence detection only touches the callback-owned scratch buffer, so it
+        # runs before taking the lock that guards the WAV file.
+        if self._silence_int_threshold > 0:
+            scratch = self._abs_scratch
+            # Integer reduction; int32 also keeps abs(-32768) from overflowing
+            if indata.shape == scratch.shape:
+                magnitude = np.abs(indata, out=scratch, dtype=np.int32)
+            else:
+                magnitude = np.abs(indata, dtype=np.int32)
+            # Explicit int64 accumulator: numpy<2 on Windows would otherwise sum in int32
+            is_silent = int(magnitude.sum(dtype=np.int64)) < self._silence_int_threshold
+
         with self._lock:
-            self._frames.append(indata.copy())
-
-            if self.silence_threshold > 0:
-                amplitude = np.abs(indata).mean() / 32768.0
-                is_silent = amplitude < self.silence_threshold
-
-                if not is_silent:
-                    if not self._speech_detected:
-                        logger.info("Speech detected")
-                    self._speech_detected = True
-                    self._silent_chunks = 0
-                else:
-                    self._silent_chunks += 1
-
-                # Only auto-stop after speech was detected, then silence
-                if self._speech_detected and self._silent_chunks >= self._silence_chunks_needed:
-                    logger.info("Silence after speech, auto-stopping")
-                    self._recording = False
-                    if self.on_auto_stop:
-                        threading.Thread(target=self.on_auto_stop, daemon=True).start()
-                    return
-
-                # Grace period expired with no speech at all
-                if not self._speech_detected and len(self._frames) >= self._grace_chunks:
-                    logger.info("Grace period expired, no speech detected")
-                    self._recording = False
-                    if self.on_auto_stop:
-                        threading.Thread(target=self.on_auto_stop, daemon=True).start()
-                    return
-
-            # Max duration safety
-            if len(self._frames) >= self._max_chunks:
-                logger.info("Max recording duration reached")
+            write = self._write
+            if write is None:
+                return
+            n = min(indata.shape[0], self._max_chunks * self._chunk_size - self._write_idx)
+            write(indata[:n].data)
+            self._write_idx += n
+            chunks_recorded = self._write_idx // self._chunk_size
+
+        if self._silence_int_threshold > 0:
+            if not is_silent:
+                if not self._speech_detected:
+                    logger.info("Speech detected")
+                self._speech_detected = True
+                self._silent_chunks = 0
+            else:
+                self._silent_chunks += 1
+
+            # Only auto-stop after speech was detected, then silence
+            if self._speech_detected and self._silent_chunks >= self._silence_chunks_needed:
+                logger.info("Silence after speech, auto-stopping")
+                self._recording = False
+                self._fire_auto_stop()
+                return
+
+            # Grace period expired with no speech at all
+            if not self._speech_detected and chunks_recorded >= self._grace_chunks:
+                logger.info("Grace period expired, no speech detected")
                 self._recording = False
-                if self.on_auto_stop:
-                    threading.Thread(target=self.on_auto_stop, daemon=True).start()
+                self._fire_auto_stop()
+                return
+
+        # Max duration safety
+        if chunks_recorded >= self._max_chunks:
+            logger.info("Max recording duration reached")
+            self._recording = False
+            self._fire_auto_stop()
+
+    def _fire_auto_stop(self) -> None:
+        # A fresh daemon thread per auto-stop (at most one per recording), so the
+        # callback's stop() isn't queued behind an earlier transcription
+        if self.on_auto_stop:
+            threading.Thread(
+                target=self._run_auto_stop, name="recorder-auto-stop", daemon=True
+            ).start()
+
+    def _run_auto_stop(self) -> None:
+        assert self.on_auto_stop is not None
+        try:
+            self.on_auto_stop()
+        except Exception:
+            logger.exception("Auto-stop callback failed")
 
     def stop(self) -> Optional[Path]:
-        """Stop recording and save audio to a temp WAV file. Returns the file path."""
-        if not self._recording and not self._frames:
+        """Stop recording and finish the temp WAV file. Returns the file path."""
+        if self._wf is None:
             logger.warning("Not recording")
             return None
 
@@ -130,25 +207,17 @@ class AudioRecorder:
             self._stream.close()
 
         with self._lock:
-            if not self._frames:
-                logger.warning("No audio captured")
+            if self._wf is None:  # a concurrent cancel() got here first
                 return None
-            audio_data = np.concatenate(self._frames, axis=0)
+            frames = self._write_idx
+            tmp_path = self._close_wav()
 
-        # Save to temp WAV
-        tmp = tempfile.NamedTemporaryFile(
-            suffix=".wav", delete=False, dir=self.temp_dir
-        )
-        tmp_path = Path(tmp.name)
-        tmp.close()
-
-        with wave.open(str(tmp_path), "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_data.tobytes())
+        if not frames:
+            logger.warning("No audio captured")
+            tmp_path.unlink(missing_ok=True)
+            return None
 
-        duration = len(audio_data) / self.sample_rate
+        duration = frames / self.sample_rate
         logger.info("Saved %.1fs of audio to %s", duration, tmp_path)
         return tmp_path
 
@@ -158,5 +227,18 @@ class AudioRecorder:
         if hasattr(self, "_stream"):
             self._stream.stop()
             self._stream.close()
-        self._frames = []
+        with self._lock:
+            if self._wf is not None:
+                self._close_wav().unlink(missing_ok=True)
+            self._write_idx = 0
         logger.info("Recording cancelled")
+
+    def _close_wav(self) -> Path:
+        """Finalize the WAV header and close the file. Caller holds the lock."""
+        assert self._wf is not None and self._wav_file is not None and self._wav_path
+        self._wf.close()  # patches the RIFF/data sizes and seeks back to the end of data
+        self._wav_file.truncate()  # drop the unused preallocated tail
+        self._wav_file.close()
+        path = self._wav_path
+        self._wf = self._write = self._wav_file = self._wav_path = None
+        return path
@@ -1,8 +1,10 @@
 """Whisper transcription using faster-whisper."""
 
+import importlib.util
 import logging
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -33,28 +35,74 @@ class WhisperTranscriber:
         self.num_threads = num_threads
 
         self._model = None  # lazy loaded
+        self._load_lock = threading.Lock()  # serializes preload() and load_model()
+        self._resolved_device: Optional[tuple[str, str]] = None
 
     def _resolve_device(self) -> tuple[str, str]:
         """Determine device and compute_type, falling back to CPU."""
         if self.device != "auto":
             return self.device, self.compute_type
-
-        try:
-            import torch
-            if torch.cuda.is_available():
-                logger.info("CUDA available — using GPU")
-                return "cuda", "float16"
-        except ImportError:
-            pass
+        if self._resolved_device is not None:
+            return self._resolved_device
+
+        # find_spec checks availability without paying for a full torch import
+        if importlib.util.find_spec("torch") is not None:
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    logger.info("CUDA available — using GPU")
+                    self._resolved_device = ("cuda", "float16")
+                    return self._resolved_device
+            except ImportError:
+                pass
 
         logger.info("Using CPU with int8 quantization")
-        return "cpu", "int8"
+        self._resolved_device = ("cpu", "int8")
+        return self._resolved_device
+
+    def preload(
+        self,
+        on_loaded: Optional[Callable[[], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Start loading the model in a background thread and return immediately.
+
+        A later load_model() or transcribe() waits for this load to finish
+        instead of starting a second one. *on_loaded* or *on_error* is called
+        from the loading thread once the outcome is known.
+        """
+        threading.Thread(
+            target=self._preload,
+            args=(on_loaded, on_error),
+            name="whisper-preload",
+            daemon=True,
+        ).start()
+
+    def _preload(
+        self,
+        on_loaded: Optional[Callable[[], None]],
+        on_error: Optional[Callable[[Exception], None]],
+    ) -> None:
+        try:
+            self.load_model()
+        except Exception as exc:
+            # transcribe() retries the load and surfaces the error to the caller
+            logger.exception("Background model load failed")
+            if on_error:
+                on_error(exc)
+            return
+        if on_loaded:
+            on_loaded()
 
     def load_model(self) -> None:
         """Load the Whisper model into memory (downloads on first run)."""
         if self._model is not None:
             return
+        with self._load_lock:
+            if self._model is None:
+                self._load_model()
 
+    def _load_model(self) -> None:
         from faster_whisper import WhisperModel
 
         device, compute_type = self._resolve_device()
@@ -86,17 +134,27 @@ class WhisperTranscriber:
 
         logger.info("Transcribing %s", audio_path)
 
+        kwargs: dict = {}
+        if self.vad_filter:
+            # Split on shorter pauses than the 2s default so less silence is decoded
+            kwargs["vad_parameters"] = {"min_silence_duration_ms": 500}
+
         segments, info = self._model.transcribe(
             str(audio_path),
             language=self.language if self.language else None,
             beam_size=self.beam_size,
             vad_filter=self.vad_filter,
             initial_prompt=self.initial_prompt or None,
+            word_timestamps=False,
+            **kwargs,
         )
 
-        text = " ".join(seg.text.strip() for seg in segments)
+        # Decode all segments up front, dropping blank ones so the join never
+        # produces doubled spaces
+        texts = [seg.text.strip() for seg in segments]
+        text = " ".join(filter(None, texts))
         logger.info(
             "Transcription complete (lang=%s, prob=%.2f, duration=%.1fs)",
             info.language, info.language_probability, info.duration,
         )
-        return text.strip()
+        return text